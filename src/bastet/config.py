@@ -16,20 +16,50 @@ from collections.abc import Callable, Iterable
 from typing import Any
 
 import argparse
+import functools
 import logging
+import os
+import stat
 import sys
-import tomllib
 from pathlib import Path
 
-import gitignore_parser  # type: ignore[import-untyped]
+import pathspec
 
 from .reporting import Reporter, reporters
 from .tools.tool import PathRepo, ToolDomain
 
 PYPROJECT_NAME = "pyproject.toml"
 GITIGNORE_NAME = ".gitignore"
+VCS_DIRS = frozenset({".git", ".hg"})
 
-GitIgnore = Callable[[Path], bool]
+# Names that mark the root of a project, in order of precedence,
+# with whether they must be a directory and a description for logging.
+_ROOT_MARKERS = {
+    PYPROJECT_NAME: (False, PYPROJECT_NAME),
+    ".git": (True, ".git folder"),
+    ".hg": (True, ".hg folder"),
+}
+
+# Tools disabled unless named in 'enable'. Ruff performs the same checks
+# as isort and flake8 in a single, much faster, process.
+DEFAULT_DISABLED = ("isort", "flake8")
+
+# Case-folded names of the reporters, for matching the config.
+_REPORTER_LOOKUP = {name.casefold(): reporter for name, reporter in reporters.items()}
+
+# Lower-cased names of the tool domains, for matching the config.
+_DOMAIN_LOOKUP = {domain.lower(): domain for domain in ToolDomain}
+
+GitIgnore = Callable[[str], bool]
+IgnoreRules = tuple[GitIgnore, ...]
+
+# Folders keyed by their path string with a trailing separator, so that
+# ancestry checks are plain string prefix comparisons.
+PathIndex = dict[str, Path]
+
+# Folders keyed by their path components, so that the ancestors of a
+# folder can be looked up directly by slicing its own components.
+PartsIndex = dict[tuple[str, ...], Path]
 
 
 class BastetConfiguration:  # pylint: disable=too-few-public-methods
@@ -77,18 +107,31 @@ class BastetConfiguration:  # pylint: disable=too-few-public-methods
         # Config the list of reporting engines to use
         self.reporters = set()
         for reporter in args.reporter or self._config_list("reporters", ["note"]):
-            if reporter.lower() not in reporters:
+            if not (reporter_class := _REPORTER_LOOKUP.get(reporter.casefold())):
                 logger.warning("Unknown reporter class %s", reporter)
                 continue
-            self.reporters.add(reporters[reporter])
-        logger.debug("Reporters set to %s")
+            self.reporters.add(reporter_class)
+        logger.debug("Reporters set to %s", self.reporters)
 
         # Determine what domains and tools are not to be run.
         # Note: "disabled" and "skip" are distinct lists; the difference is
-        # "skip" can only be specified on the CLI. The two lists are merged.
+        # "skip" can only be specified on the CLI. The two lists are merged,
+        # along with any of the default disabled tools that are not enabled.
+        enabled = {item.lower() for item in args.enable or self._config_list("enable", [])}
         disabled = args.disable or self._config_list("disable", [])
-        disabled += args.skip or []
+        disabled = [
+            *(tool for tool in DEFAULT_DISABLED if tool not in enabled),
+            *disabled,
+            *(args.skip or []),
+        ]
         self.skip_domains, self.skip_tools = _tools_or_domains(disabled)
+
+        # The mypy daemon replaces mypy, as the two share a cache. It is opt-in,
+        # as it leaves a process running, so is only used when it is enabled.
+        if "dmypy" in enabled:
+            self.skip_tools.add("mypy")
+        else:
+            self.skip_tools.add("dmypy")
         logger.debug("disabled domains: %s", self.skip_domains)
         logger.debug("disabled tools: %s", self.skip_tools)
 
@@ -150,6 +193,11 @@ def add_options(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
         nargs=argparse.ZERO_OR_MORE,
         help="Names of tools and domains to disable (overrides config).",
     )
+    parser.add_argument(
+        "--enable",
+        nargs=argparse.ZERO_OR_MORE,
+        help="Names of tools that are disabled by default to run (overrides config).",
+    )
     parser.add_argument(
         "--exclude",
         nargs=argparse.ZERO_OR_MORE,
@@ -178,26 +226,33 @@ class PathGatherer:  # pylint: disable=too-few-public-methods,too-many-instance-
     root: Path
     logger: logging.Logger
 
-    _potential_py_path: set[Path]
-    _python_path: set[Path]
-    _python_module_path: set[Path]
+    _initial_py_path: PathIndex
+    _potential_py_path: PathIndex
+    _python_path: PathIndex
+    _python_module_path: PartsIndex
     _python_files: set[Path]
     _exclusion: set[Path]
+    _gitignore_cache: dict[Path, pathspec.GitIgnoreSpec]
 
     def __init__(self, logger: logging.Logger, root: Path, folders: list[Path]) -> None:
         """
         Tool for locating PYTHON_PATH and non-namespace python module roots.
         """
 
-        self.root = root.absolute()
+        # Path.absolute() calls getcwd() each time, so it is only looked up once.
+        self._cwd = os.getcwd()  # noqa: PTH109 - string path, not a Path.
+
+        self.root = self._absolute(root)
         self.logger = logger
 
         self._initial_folders = folders
-        self._potential_py_path = set()
-        self._python_path = set()
-        self._python_module_path = set()
+        self._initial_py_path = {}
+        self._potential_py_path = {}
+        self._python_path = {}
+        self._python_module_path = {}
         self._python_files = set()
         self._exclusion = set()
+        self._gitignore_cache = {}
 
     def gather(self, exclude: list[str], pypath_selector: set[str]) -> PathRepo:
         """
@@ -217,21 +272,22 @@ class PathGatherer:  # pylint: disable=too-few-public-methods,too-many-instance-
         match them.
         """
 
-        self._potential_py_path = self._initial_path()
-        self._python_path = set()
-        self._python_module_path = set()
-
-        self.logger.debug("Adding '.git' and '.hg' to gitignore list")
-        _ignores = [lambda path: path.name in [".git", ".hg"]]
+        self._initial_py_path = self._initial_path()
+        self._potential_py_path = self._initial_py_path.copy()
+        self._python_path = {}
+        self._python_module_path = {}
 
+        # The config exclusions and the local git exclusions are both anchored
+        # at the project root, so can be combined into a single PathSpec.
         for rule in exclude:
             self.logger.debug("Adding %s to gitignore list", rule)
-            _ignores.append(gitignore_parser.rule_from_pattern(rule, self.root, "config"))
+        root_spec = pathspec.GitIgnoreSpec.from_lines(exclude)
 
         local_ignores = self.root / ".git" / "info" / "exclude"
-        if local_ignores.exists():
-            self.logger.debug("Adding %s to gitignore list", local_ignores)
-            _ignores.append(gitignore_parser.parse_gitignore(local_ignores, self.root))
+        if local_ignores.is_file():
+            root_spec += self._load_gitignore(local_ignores)
+
+        _ignores = _gitignore_matchers(root_spec, self.root)
 
         locations_to_scan = self._initial_folders if self._initial_folders else [self.root]
         for location in locations_to_scan:
@@ -239,81 +295,160 @@ class PathGatherer:  # pylint: disable=too-few-public-methods,too-many-instance-
                 self.logger.warning("%s does not exist, can not scan", location)
                 continue
 
-            self._scan_dir(location, _ignores, pypath_selector)
+            self._scan_dir(self._absolute(location), _ignores, frozenset(pypath_selector))
 
-        self.logger.debug("PYTHON_PATH:      %s", self._python_path)
-        self.logger.debug("Module Roots:     %s", self._python_module_path)
+        self.logger.debug("PYTHON_PATH:      %s", self._python_path.values())
+        self.logger.debug("Module Roots:     %s", self._python_module_path.values())
 
         return PathRepo(
             self.root,
             self.root / "reports",
             frozenset(self._exclusion),
-            frozenset(self._python_path),
+            frozenset(self._python_path.values()),
             frozenset(self._python_files),
-            frozenset(self._python_module_path),
+            frozenset(self._python_module_path.values()),
         )
 
-    def _initial_path(self) -> set[Path]:
-        paths = set()
+    def _initial_path(self) -> PathIndex:
+        paths: PathIndex = {}
+
+        root_prefix = _dir_prefix(self.root)
 
         for potential in sys.path:
-            path = Path(potential).absolute()
-            if self.root in path.parents:
+            # Equivalent to os.path.abspath, without a getcwd() call per entry.
+            absolute = os.path.normpath(os.path.join(self._cwd, potential))  # noqa: PTH118
+            prefix = _dir_prefix(absolute)
+            if prefix.startswith(root_prefix) and prefix != root_prefix:
+                path = Path(prefix)
                 self.logger.debug("Potential PYTHON_PATH: %s", path)
-                paths.add(path)
+                paths[prefix] = path
 
-        if self.root not in paths:
+        if root_prefix not in paths:
             self.logger.debug("Potential PYTHON_PATH: %s", self.root)
-            paths.add(self.root)
+            paths[root_prefix] = self.root
 
         return paths
 
-    def _scan_dir(self, path: Path, ignores: list[GitIgnore], selector: set[str]) -> None:
-        potential_gitignore = path / GITIGNORE_NAME
-        if potential_gitignore.is_file():
-            self.logger.debug("Adding %s to gitignore list", potential_gitignore)
-            ignores = ignores.copy()
-            ignores.append(gitignore_parser.parse_gitignore(potential_gitignore, path))
+    def _absolute(self, path: Path) -> Path:
+        return path if path.is_absolute() else Path(self._cwd, path)
+
+    def _load_gitignore(self, file: Path) -> pathspec.GitIgnoreSpec:
+        """
+        Parse a gitignore file into a PathSpec, re-using any previous parse of it.
+        """
+
+        if file not in self._gitignore_cache:
+            self.logger.debug("Adding %s to gitignore list", file)
+            lines = file.read_text(encoding="utf-8", errors="replace").splitlines()
+            self._gitignore_cache[file] = pathspec.GitIgnoreSpec.from_lines(lines)
+
+        return self._gitignore_cache[file]
+
+    def _scan_dir(self, root: Path, ignores: IgnoreRules, selector: frozenset[str]) -> None:
+        # Directories still to be scanned, with the ignore rules inherited from their parent.
+        # Directories are only added once they have survived the ignore checks.
+        pending: list[tuple[str, IgnoreRules]] = [(os.fspath(root), ignores)]
+
+        # Python files are processed once the whole tree has been walked, deepest first,
+        # so that src/ and tests/ are detected before a loose file (e.g. setup.py)
+        # claims the directory above them as a PYTHONPATH entry.
+        found: list[tuple[list[Path], bool]] = []
+
+        if root.name in selector:
+            self._add_potential_py_path(root)
+
+        while pending:
+            directories, (files, is_package) = self._scan_entries(*pending.pop(), selector)
+            pending.extend(directories)
+            if files:
+                found.append((files, is_package))
+
+        for files, is_package in reversed(found):
+            self._process_python_files(files, is_package=is_package)
+
+    def _scan_entries(
+        self,
+        dirpath: str,
+        ignores: IgnoreRules,
+        selector: frozenset[str],
+    ) -> tuple[list[tuple[str, IgnoreRules]], tuple[list[Path], bool]]:
+        """
+        List one directory, returning the sub-directories to scan and its python files.
+        """
 
-        if path.name in selector and path not in self._potential_py_path:
+        entries = self._list_dir(dirpath)
+        names = {entry.name for entry in entries}
+
+        if any(entry.name == GITIGNORE_NAME and entry.is_file() for entry in entries):
+            path = Path(dirpath)
+            gitignore = self._load_gitignore(path / GITIGNORE_NAME)
+            ignores += _gitignore_matchers(gitignore, path)
+
+        # The entry types come from the directory listing itself, so classifying
+        # them needs no extra stat calls. Symlinked directories are not followed.
+        # Directories are matched with a trailing separator, as in git.
+        directories = []
+        python_files = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in VCS_DIRS or _is_ignored(entry.path + os.sep, ignores):
+                    self._exclusion.add(Path(entry.path))
+                    continue
+
+                if entry.name in selector:
+                    self._add_potential_py_path(Path(entry.path))
+
+                directories.append((entry.path, ignores))
+
+            elif entry.name.endswith(".py") and not _is_ignored(entry.path, ignores):
+                python_files.append(Path(entry.path))
+
+        return directories, (python_files, "__init__.py" in names)
+
+    def _list_dir(self, dirpath: str) -> list[os.DirEntry[str]]:
+        try:
+            with os.scandir(dirpath) as scanner:
+                return list(scanner)
+        except OSError as err:
+            self.logger.warning("Unable to scan %s: %s", dirpath, err)
+            return []
+
+    def _add_potential_py_path(self, path: Path) -> None:
+        prefix = _dir_prefix(path)
+
+        if prefix not in self._potential_py_path:
             self.logger.debug("Potential PYTHON_PATH: %s", path)
-            self._potential_py_path.add(path)
+            self._potential_py_path[prefix] = path
 
-        for file in path.iterdir():
-            if any(ignore(file) for ignore in ignores):
-                if file.is_dir():
-                    self._exclusion.add(file)
-                continue
+    def _process_python_files(self, files: list[Path], *, is_package: bool) -> None:
+        """
+        Record the python files from a single directory.
 
-            if file.is_dir():
-                self._scan_dir(file, ignores, selector)
-                continue
+        All the files share a parent, so the module root and PYTHONPATH
+        detection is done once for the directory, using the first file.
+        """
 
-            if file.name.endswith(".py"):
-                self._process_python_file(file)
+        self._python_files.update(files)
 
-    def _process_python_file(self, file: Path) -> None:
-        self._python_files.add(file)
+        file = files[0]
 
-        if self._add_path(self._python_module_path, file.parent, remove_children=True):
+        if self._add_module_path(self._python_module_path, file.parent):
             self.logger.debug("Marking %s as a module path", file.parent)
 
         if self._closest_relative(self._python_path, file):
             return
 
         # Module roots can't be a PYTHONPATH entry
-        my_dir_cant_by_pypath = (file.parent / "__init__.py").exists()
-
         py_root = self._closest_relative(
             self._potential_py_path,
-            file.parent if my_dir_cant_by_pypath else file,
+            file.parent if is_package else file,
         )
 
         if not py_root:
             self.logger.debug("Unable to locate a potential PYTHONPATH for %s", file)
             return
 
-        if py_root not in self._initial_path():
+        if _dir_prefix(py_root) not in self._initial_py_path:
             self.logger.warning("Detecting %s as a path, but not in PYTHON_PATH", py_root)
 
         self.logger.debug(
@@ -321,54 +456,102 @@ class PathGatherer:  # pylint: disable=too-few-public-methods,too-many-instance-
             py_root,
             file,
         )
-        self._potential_py_path.remove(py_root)
-        self._python_path.add(py_root)
+        prefix = _dir_prefix(py_root)
+        del self._potential_py_path[prefix]
+        self._python_path[prefix] = py_root
 
     @staticmethod
-    def _add_path(paths: set[Path], path: Path, *, remove_children: bool) -> bool:
-        if path in paths:
-            return False
+    def _add_module_path(paths: PartsIndex, path: Path) -> bool:
+        """
+        Add a path to the index, unless it or one of its ancestors is already present.
 
-        for _path in paths:
-            if path.is_relative_to(_path):
+        Any descendants of the path already in the index are removed.
+        """
+
+        parts = path.parts
+
+        # Check the path and each of its ancestors, rather than each entry in the index.
+        for depth in range(len(parts), 0, -1):
+            if parts[:depth] in paths:
                 return False
 
-        if remove_children:
-            paths.difference_update({x for x in paths if x.is_relative_to(path)})
+        depth = len(parts)
+        for child in [x for x in paths if x[:depth] == parts]:
+            del paths[child]
 
-        paths.add(path)
+        paths[parts] = path
 
         return True
 
     @staticmethod
-    def _closest_relative(paths: set[Path], path: Path) -> Path | None:
-        _closest: Path | None = None
-        for _path in paths:
-            if _path not in path.parents:
-                continue
+    def _closest_relative(paths: PathIndex, path: Path) -> Path | None:
+        target = os.fspath(path)
 
-            if _closest and _closest.is_relative_to(_path):
-                continue
+        # Check each ancestor of the path, closest first, rather than each entry in the index.
+        end = target.rfind(os.sep)
+        while end >= 0:
+            if (closest := paths.get(target[: end + 1])) is not None:
+                return closest
+            end = target.rfind(os.sep, 0, end)
 
-            _closest = _path
+        return None
 
-        return _closest
+
+def _dir_prefix(path: Path | str) -> str:
+    """
+    The path as a string with a trailing separator, for use in a PathIndex.
+    """
+
+    return os.path.join(path, "")  # noqa: PTH118 - string prefix, not a Path.
+
+
+def _gitignore_matchers(spec: pathspec.GitIgnoreSpec, base: Path) -> IgnoreRules:
+    """
+    Create the ignore rules for a PathSpec anchored at the given directory.
+
+    The rule takes an absolute path string, which must end in a separator
+    if the path is a directory. Paths outside the base directory never match.
+    An empty PathSpec produces no rules at all.
+    """
+
+    if not spec.patterns:
+        return ()
+
+    prefix = _dir_prefix(base)
+
+    def _ignored(path: str) -> bool:
+        return path.startswith(prefix) and spec.match_file(path.removeprefix(prefix))
+
+    return (_ignored,)
+
+
+def _is_ignored(path: str, ignores: IgnoreRules) -> bool:
+    """
+    Check a path against each ignore rule, stopping at the first match.
+
+    This is a plain loop rather than any() over a generator, as it is
+    called for every file and folder in the project.
+    """
+
+    for ignored in ignores:  # noqa: SIM110 - avoids creating a generator per call.
+        if ignored(path):
+            return True
+
+    return False
 
 
 def _tools_or_domains(items: Iterable[str]) -> tuple[set[ToolDomain], set[str]]:
     """
     Splits a list of config references into a set of domains and a set of tools.
     """
-    domains = set()
-    tools = set()
-
-    _domains = {domain.lower(): domain for domain in ToolDomain}
+    domains: set[ToolDomain] = set()
+    tools: set[str] = set()
 
     for _item in items:
         item = _item.lower()
 
-        if item in _domains:
-            domains.add(_domains[item])
+        if domain := _DOMAIN_LOOKUP.get(item):
+            domains.add(domain)
         else:
             tools.add(item)
 
@@ -380,12 +563,16 @@ def _load_config(logger: logging.Logger, folder: Path) -> dict[str, Any]:
 
     file = folder / PYPROJECT_NAME
 
-    if not file.is_file():
+    try:
+        file_stat = file.stat()
+    except OSError:
+        file_stat = None
+
+    if not file_stat or not stat.S_ISREG(file_stat.st_mode):
         logger.warning("config file %s not found", file)
         return {}
 
-    with file.open("rb") as in_file:
-        toml = tomllib.load(in_file)
+    toml = _read_toml(file, file_stat.st_mtime_ns)
 
     config: dict[str, Any] = toml.get("tool", {}).get("bastet", {})
 
@@ -397,6 +584,21 @@ def _load_config(logger: logging.Logger, folder: Path) -> dict[str, Any]:
     return config
 
 
+@functools.lru_cache(maxsize=4)
+def _read_toml(file: Path, _mtime_ns: int) -> dict[str, Any]:
+    """
+    Parse a TOML file, re-using the result until the file is modified.
+
+    The modification time is only used as part of the cache key.
+    The returned dictionary is shared between callers, and must not be modified.
+    """
+
+    import tomllib  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+
+    with file.open("rb") as in_file:
+        return tomllib.load(in_file)
+
+
 def _find_pyproject(logger: logging.Logger) -> Path | None:
     """
     Search for file pyproject.toml in the parent directories recursively.
@@ -404,23 +606,41 @@ def _find_pyproject(logger: logging.Logger) -> Path | None:
     It resolves symlinks, so if there is any symlink up in the tree,
     it does not respect them.
     """
-    current_dir = Path.cwd().resolve()
 
-    while True:
-        if (current_dir / PYPROJECT_NAME).is_file():
-            logger.debug("Selecting %s due to %s", current_dir, PYPROJECT_NAME)
-            return current_dir
+    found = _locate_project_root(Path.cwd().resolve())
+
+    if not found:
+        logger.error("No repo root found before hitting root directory.")
+        return None
+
+    root, reason = found
+    logger.debug("Selecting %s due to %s", root, reason)
+    return root
+
 
-        if (current_dir / ".git").is_dir():
-            logger.debug("Selecting %s due to .git folder", current_dir)
-            return current_dir
+@functools.cache
+def _locate_project_root(current_dir: Path) -> tuple[Path, str] | None:
+    """
+    Walk up from a directory to the first that looks like a project root.
+
+    Each directory is listed once, rather than probing for each marker.
+    The result is cached per starting directory, as the configuration can be
+    built multiple times in the same process.
+    """
+
+    while True:
+        try:
+            with os.scandir(current_dir) as entries:
+                markers = {entry.name: entry for entry in entries if entry.name in _ROOT_MARKERS}
+        except OSError:
+            markers = {}
 
-        if (current_dir / ".hg").is_dir():
-            logger.debug("Selecting %s due to .hg folder", current_dir)
-            return current_dir
+        for name, (needs_dir, reason) in _ROOT_MARKERS.items():
+            entry = markers.get(name)
+            if entry and (entry.is_dir() if needs_dir else entry.is_file()):
+                return current_dir, reason
 
         if current_dir == current_dir.parent:
-            logger.error("No repo root found before hitting root directory.")
             return None
 
         current_dir = current_dir.parent
@@ -203,9 +203,8 @@ class ToolReport:
         stderr_task = mirror_pipe(self._stderr, *filter(present, stderr))
 
         # Set up the tool's process_results function, which generates Annotations and ToolErrors.
-        note_source = self._annotate_tool(self._tool.process_results(results_reader))
         notes_task = self.mirror_notes(
-            note_source,
+            self._tool.process_results(results_reader),
             list(filter(present, annotation_handlers)),
             list(filter(present, exception_handlers)),
         )
@@ -218,15 +217,6 @@ class ToolReport:
             loop.create_task(notes_task),
         ]
 
-    async def _annotate_tool(
-        self,
-        source: AsyncIterable[Annotation | ToolError],
-    ) -> AsyncIterable[Annotation | ToolError]:
-        async for item in source:
-            if isinstance(item, Annotation):
-                item.tool = self._tool
-            yield item
-
     async def __aexit__(
         self,
         exc_type: type[BaseException] | None,
@@ -255,10 +245,15 @@ class ToolReport:
         exception sink will receive copies of each annotation or exception
         respectively. They are also added to this ToolReport's internal
         buffers, for use in summaries.
+
+        Annotations are marked as coming from this report's tool here,
+        rather than in a wrapping generator, so that each annotation only
+        passes through the tool's own generator.
         """
 
         async for note in source:
             if isinstance(note, Annotation):
+                note.tool = self._tool
                 self._annotations.append(note)
                 await gather(*(sink(note) for sink in annotation_handlers))
             elif isinstance(note, ToolError):
@@ -309,7 +304,7 @@ async def mirror_pipe(pipe: StreamReader, *mirrors: BinaryIO | StreamReader) ->
     eol = True
 
     while not pipe.at_eof():
-        block = await pipe.read(4096)
+        block = await pipe.read(65536)
 
         # Only do anything if content appeared.
         if not block:
@@ -23,17 +23,34 @@ or "some failures" message.
 
 from __future__ import annotations as _future_annotations
 
+import contextlib
+import functools
 import shutil
+import signal
 import sys
 import textwrap
 import traceback
 
-from clint.textui import colored  # type: ignore[import-untyped]
-
 from bastet.tools import Annotation, Status, Tool, ToolError, ToolResults
 
 from .abc import Reporter, ReportInstance, ReportStreams
 
+# ANSI colour codes, which are only used when writing to a terminal.
+_COLOUR = sys.stdout.isatty()
+_RED = "\x1b[31m" if _COLOUR else ""
+_GREEN = "\x1b[32m" if _COLOUR else ""
+_YELLOW = "\x1b[33m" if _COLOUR else ""
+_BOLD_WHITE = "\x1b[1;37m" if _COLOUR else ""
+_RESET = "\x1b[0m" if _COLOUR else ""
+
+_STATUS_COLOURS = {
+    Status.EXCEPTION: _RED,
+    Status.ISSUE: _RED,
+    Status.WARNING: _YELLOW,
+    Status.FIXED: _YELLOW,
+    Status.PASSED: _GREEN,
+}
+
 
 class AnnotationReporter(Reporter):
     """
@@ -69,10 +86,10 @@ class AnnotationReporter(Reporter):
         of how many passing and non-passing annotations.
         """
 
-        sys.stdout.write(terminal_header("Summary"))
+        output = [terminal_header("Summary")]
 
         for tool, result in results.results.items():
-            sys.stdout.write(
+            output.append(
                 self.format_result_str(
                     tool.domain,
                     tool.name,
@@ -82,11 +99,14 @@ class AnnotationReporter(Reporter):
                 ),
             )
 
-        sys.stdout.write("\n")
+        output.append("\n")
         if results.success:
-            sys.stdout.write(f"Congratulations! {colored.green('Proceed to Upload')}\n")
+            output.append(f"Congratulations! {_GREEN}Proceed to Upload{_RESET}\n")
         else:
-            sys.stdout.write(f"\nBad news! {colored.red('At least one failure!')}\n")
+            output.append(f"\nBad news! {_RED}At least one failure!{_RESET}\n")
+
+        sys.stdout.write("".join(output))
+        sys.stdout.flush()
 
     async def close(self) -> None:
         """
@@ -109,9 +129,9 @@ class AnnotationReporter(Reporter):
         more than zero Pass annotations, that count is also shown.
         """
 
-        status = color_by_status(short_stats(status), status)
+        label = color_by_status(short_stats(status), status)
 
-        basic = f"[{status}] {(domain + ' :: ' + tool_name):18s} {annotation_count:3d} issues"
+        basic = f"[{label}] {(domain + ' :: ' + tool_name):18s} {annotation_count:3d} issues"
 
         if pass_count:
             basic += f" {pass_count:3d} passed"
@@ -151,19 +171,19 @@ class _AnnotationReporter(ReportInstance):
 
         return ReportStreams(None, None, self.handle_annotation, self.handle_exception)
 
-    def header(self) -> None:
+    def header(self) -> str:
         """
-        Emit a header tile for this tool, if not already emitted.
+        Get the header tile for this tool, if it has not already been emitted.
 
-        We don't want to put a header until we have actual content to post.
+        We don't want to put a header until we have actual content to post,
+        so the header is written along with the first annotation or exception.
         """
 
         if self._header_written:
-            return
+            return ""
 
         self._header_written = True
-        sys.stdout.write(terminal_header(f"{self.tool.domain} :: {self.tool.name}"))
-        sys.stdout.flush()
+        return terminal_header(f"{self.tool.domain} :: {self.tool.name}")
 
     async def handle_annotation(self, annotation: Annotation) -> None:
         """
@@ -181,16 +201,18 @@ class _AnnotationReporter(ReportInstance):
         if annotation.status == Status.PASSED:
             return
 
-        # Output the header line for this tool (if we haven't already)
-        self.header()
-
         a = annotation
-        sys.stdout.write(f"{a.file_str} [{color_by_status(a.code, a.status)}]: {a.message}\n")
+        output = [
+            # The header line for this tool (if we haven't already output it)
+            self.header(),
+            f"{a.file_str} [{color_by_status(a.code, a.status)}]: {a.message}\n",
+        ]
 
-        if annotation.description:
-            sys.stdout.write(textwrap.indent(annotation.description.rstrip(), "  "))
-            sys.stdout.write("\n")
+        if description := annotation.description:
+            output.append(_indent(description.rstrip()))
+            output.append("\n")
 
+        sys.stdout.write("".join(output))
         sys.stdout.flush()
 
     async def handle_exception(self, problem: ToolError) -> None:
@@ -198,11 +220,10 @@ class _AnnotationReporter(ReportInstance):
         Outputs the exception as just the exception without a full stack trace.
         """
 
-        # Output the header line for this tool (if we haven't already)
-        self.header()
+        # Include the header line for this tool (if we haven't already output it)
+        output = [self.header(), *traceback.format_exception_only(ToolError, value=problem), "\n"]
 
-        sys.stdout.write("".join(traceback.format_exception_only(ToolError, value=problem)))
-        sys.stdout.write("\n")
+        sys.stdout.write("".join(output))
         sys.stdout.flush()
 
     async def end(self) -> None:
@@ -215,35 +236,53 @@ def terminal_header(content: str) -> str:
     """
     Puts a heading line across the width of the terminal.
 
-    Width is recalculated live in case the terminal changes sizes between calls.
+    Width is cached, and recalculated if the terminal is resized between calls.
     Fallback is to assume 80 char wide - which seems a reasonable minimum for terminal size.
 
     :return: int terminal width
     """
-    width = shutil.get_terminal_size()[0]
+    width = _terminal_width()
 
     trailing_dash_count = min(80, width) - 6 - len(content)
-    return (
-        "\n"
-        + str(colored.white(f"{'=' * 4} {content} {'=' * trailing_dash_count}", bold=True))
-        + "\n"
-    )
+    return f"\n{_BOLD_WHITE}{'=' * 4} {content} {'=' * trailing_dash_count}{_RESET}\n"
+
 
+def _indent(text: str) -> str:
+    """
+    Indent each line of the text by two spaces.
 
-def color_by_status(content: str, status: Status) -> colored.ColoredString:
+    Most descriptions are a single line, which do not need textwrap's line splitting.
+    """
+
+    return textwrap.indent(text, "  ") if "\n" in text else "  " + text
+
+
+@functools.cache
+def _terminal_width() -> int:
+    """
+    The width of the terminal, cached until it is resized.
+    """
+
+    return shutil.get_terminal_size()[0]
+
+
+# Clear the cached width when the terminal is resized (POSIX only), unless
+# something else is already handling the signal.
+if hasattr(signal, "SIGWINCH") and signal.getsignal(signal.SIGWINCH) == signal.SIG_DFL:
+    # Signal handlers can only be set from the main thread.
+    with contextlib.suppress(ValueError):
+        signal.signal(signal.SIGWINCH, lambda *_: _terminal_width.cache_clear())
+
+
+def color_by_status(content: str, status: Status) -> str:
     """
     Terminal colours representing different status.
     """
 
-    mapping = {
-        Status.EXCEPTION: "RED",
-        Status.ISSUE: "RED",
-        Status.WARNING: "YELLOW",
-        Status.FIXED: "YELLOW",
-        Status.PASSED: "GREEN",
-    }
+    if colour := _STATUS_COLOURS.get(status):
+        return f"{colour}{content}{_RESET}"
 
-    return colored.ColoredString(mapping.get(status, "RESET"), content)
+    return content
 
 
 def short_stats(status: Status) -> str:
@@ -18,6 +18,9 @@ from bastet.tools import Annotation, Status, Tool, ToolResults
 
 from .abc import Reporter, ReportInstance, ReportStreams
 
+# The parts of an annotation that identify it within a single line of code.
+_IssueKey = tuple[Tool | None, str, str]
+
 
 class GitHubReporter(Reporter):
     """
@@ -40,17 +43,22 @@ class GitHubReporter(Reporter):
         """
 
         issues = list(self.group_issues(results.annotations))
+        issues.sort()
 
-        sys.stdout.write("::group::Annotations\n")
-        for issue in sorted(issues):
+        output = ["::group::Annotations\n"]
+        for issue in issues:
+            _, line, col = issue.source
             description = (issue.description or "").replace("\n", "%0A")
-            sys.stdout.write(
-                f"::error file={issue.filename},line={issue.source[1]},"
-                f"col={issue.source[2]},title={issue.message}::{description}\n",
+            output.append(
+                f"::error file={issue.filename},line={line},"
+                f"col={col},title={issue.message}::{description}\n",
             )
-        sys.stdout.write("::endgroup::\n")
+        output.append("::endgroup::\n")
+
+        output.append(f"Total Issues: {len(issues)}\n")
 
-        sys.stdout.write(f"Total Issues: {len(issues)}\n")
+        sys.stdout.write("".join(output))
+        sys.stdout.flush()
 
     def group_issues(self, annotations: Iterable[Annotation]) -> Iterable[Annotation]:
         """
@@ -63,20 +71,23 @@ class GitHubReporter(Reporter):
         unchanged. Otherwise, an aggregate annotation for that line is returned.
         """
 
-        grouping: dict[tuple[pathlib.Path, int, int], set[Annotation]] = {}
+        grouping: dict[tuple[pathlib.Path, int, int], dict[_IssueKey, Annotation]] = {}
 
-        # Group annotations by file and line.
+        # Group annotations by file and line, de-duplicating by tool, code, and message.
         for annotation in annotations:
             if annotation.status < Status.WARNING:
                 continue
 
-            grouping.setdefault(annotation.source, set()).add(annotation)
+            key = (annotation.tool, annotation.code, annotation.message)
+            grouping.setdefault(annotation.source, {}).setdefault(key, annotation)
 
         # Process the groups
-        for source, issues in grouping.items():
+        for source, group in grouping.items():
+            issues = group.values()
+
             # Single item groups are returned as-is.
             if len(issues) == 1:
-                yield issues.pop()
+                yield from issues
                 continue
 
             status = max(issue.status for issue in issues)
@@ -98,10 +109,14 @@ class GitHubReporter(Reporter):
         else:
             header = f"- {issue.message}"
 
-        if not issue.description:
+        if not (description := issue.description):
             return header
 
-        return f"{header}\n{textwrap.indent(issue.message.strip(), '  ')}"
+        description = description.strip()
+        if "\n" in description:
+            return f"{header}\n{textwrap.indent(description, '  ')}"
+
+        return f"{header}\n  {description}"
 
     async def close(self) -> None:
         """
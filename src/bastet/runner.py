@@ -19,6 +19,7 @@ import subprocess  # nosec
 
 from .config import BastetConfiguration
 from .reporting import ReportHandler
+from .reporting.abc import ToolReport
 from .tools import (
     Annotation,
     Tool,
@@ -42,6 +43,7 @@ class BastetRunner:  # pylint: disable=too-few-public-methods
     reporter: ReportHandler
     config: BastetConfiguration
     timeout: int = 30
+    jobs: int = os.cpu_count() or 1
 
     def __init__(self, config: BastetConfiguration, reporter: ReportHandler) -> None:
         """
@@ -56,11 +58,17 @@ class BastetRunner:  # pylint: disable=too-few-public-methods
         self.reporter = reporter
         self.config = config
 
+        # The inherited environment is the same for every tool.
+        self._environment = dict(os.environ)
+
     async def run(self) -> ToolResults:
         """
         Run the tool chain, calling each selected tool and processing the results.
 
-        This function will iterate through the selected domains
+        This function will iterate through the selected domains.
+        Tools in the Format domain modify the files, so are run one at a time
+        before any other tools. The tools in all the other domains only read
+        the files, and are run concurrently.
         """
 
         # Ensure the reporting location exists.
@@ -68,44 +76,93 @@ class BastetRunner:  # pylint: disable=too-few-public-methods
 
         results = ToolResults()
 
+        formatters: list[Tool] = []
+        checks: list[Tool] = []
+
+        # The enabled tools are the same for every domain.
+        enabled = enabled_tools(self.config)
+
         domain: ToolDomain
-        async with self.reporter:
-            for domain in gather_domains(self.config):
-                tools = gather_tools(domain, self.config)
+        for domain in gather_domains(self.config):
+            tools = gather_tools(domain, self.config, enabled)
+            (formatters if domain == ToolDomain.FORMAT else checks).extend(tools)
 
-                for tool in tools:
-                    exit_code, annotations, exceptions = await self._run_tool(tool)
+        async with self.reporter:
+            for tools, jobs in ((formatters, 1), (checks, self.jobs)):
+                for tool, outcome in zip(tools, await self._run_tools(tools, jobs), strict=True):
+                    exit_code, annotations, exceptions = outcome
                     await results.record(tool, annotations, exceptions, exit_code)
 
         await self.reporter.summarise(results)
 
         return results
 
-    async def _run_tool(
+    async def _run_tools(
         self,
-        tool: Tool,
-    ) -> tuple[int, list[Annotation], list[ToolError]]:
+        tools: list[Tool],
+        jobs: int,
+    ) -> list[tuple[int, list[Annotation], list[ToolError]]]:
+        """
+        Run a list of tools, reporting their outputs in order.
+
+        The tools are independent processes, so up to `jobs` of them are
+        run at once and their outputs buffered. The buffers are then passed
+        to the reporters one tool at a time, so the reports are the same as
+        if they had been run sequentially.
+
+        :param tools:
+            The tool definitions to run.
+        :param jobs:
+            The maximum number of tools to run at the same time.
+        """
+
+        # In some edge cases, like configuring pytest, the reporting toolchain
+        # may reconfigure the tool slightly. Thus, we create the reports before
+        # fetching the commands.
+        reports = [await self.reporter.report(tool) for tool in tools]
+
+        # The semaphore is first-come-first-served, so the tools start in order.
+        limit = asyncio.Semaphore(jobs)
+
+        # Tools running at the same time share the CPU (and some, like pylint,
+        # use every core themselves), so each is allowed proportionally longer.
+        time_limit = self.timeout * max(1, min(jobs, len(tools)))
+
+        async def _execute(tool: Tool) -> tuple[int, bytes, bytes]:
+            async with limit:
+                return await self._execute(tool, time_limit)
+
+        # If any tool fails to run, the task group cancels (and so kills) the others.
+        # A single failure is re-raised as itself, rather than in an ExceptionGroup.
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(_execute(tool)) for tool in tools]
+        except ExceptionGroup as errors:
+            if len(errors.exceptions) == 1:
+                raise errors.exceptions[0] from None
+            raise
+
+        return [
+            await self._replay(report, *task.result())
+            for report, task in zip(reports, tasks, strict=True)
+        ]
+
+    async def _execute(self, tool: Tool, time_limit: float) -> tuple[int, bytes, bytes]:
         """
         Helper function to run an external program as a check.
 
-        The output of the tool is copied to the tool's own process_results
-        function, and to all reporters that request it. The reports can
-        also request the standard error stream, and/or the annotations being
-        produced by the process_results function.
+        The standard output and error of the program are buffered,
+        and returned alongside the exit code.
 
         :param tool:
             The tool definition to run.
+        :param time_limit:
+            The number of seconds to wait for the tool before killing it.
         """
 
-        # In some edge cases, like configuring pytest, the reporting toolchain
-        # may reconfigure the tool slightly. Thus, we create the report before
-        # fetching the command.
-        reporter = await self.reporter.report(tool)
-
         command = tool.get_command()
 
-        env = os.environ.copy()
-        env.update(tool.get_environment())
+        env = {**self._environment, **tool.get_environment()}
 
         process = await asyncio.create_subprocess_exec(
             *command,
@@ -120,25 +177,66 @@ class BastetRunner:  # pylint: disable=too-few-public-methods
             error = f"pipes for process {tool.name} not created"
             raise subprocess.SubprocessError(error)
 
-        async with reporter.start(process.stdout, process.stderr):
-            # This is trimmed down version of subprocess.run().
-            try:
-                await asyncio.wait_for(process.wait(), timeout=self.timeout)
-            except TimeoutError:
-                process.kill()
-                # run uses communicate() on windows. May be needed.
-                # However, as we are running the pipes manually, it may not be.
-                # Seems not to be
-                await process.wait()
-            # Re-raise all non-timeout exceptions.
-            except Exception:
-                process.kill()
-                await process.wait()
-                raise
+        # Drain both pipes in the background while waiting for the process,
+        # so it can never block on a full pipe, and so that any output
+        # produced before a timeout is still reported.
+        stdout = asyncio.ensure_future(process.stdout.read())
+        stderr = asyncio.ensure_future(process.stderr.read())
+
+        # This is trimmed down version of subprocess.run().
+        try:
+            await asyncio.wait_for(process.wait(), timeout=time_limit)
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+        # Re-raise all non-timeout exceptions (including cancellation),
+        # without leaving the process or the pipe readers running.
+        except BaseException:
+            process.kill()
+            stdout.cancel()
+            stderr.cancel()
+            await asyncio.gather(stdout, stderr, return_exceptions=True)
+            await process.wait()
+            raise
 
         return_code = process.returncode
         return_code = return_code if return_code is not None else 1
 
+        return return_code, await stdout, await stderr
+
+    @staticmethod
+    async def _replay(
+        reporter: ToolReport,
+        return_code: int,
+        stdout: bytes,
+        stderr: bytes,
+    ) -> tuple[int, list[Annotation], list[ToolError]]:
+        """
+        Feed the buffered output of a tool to its report.
+
+        The output of the tool is copied to the tool's own process_results
+        function, and to all reporters that request it. The reports can
+        also request the standard error stream, and/or the annotations being
+        produced by the process_results function.
+
+        :param reporter:
+            The report for the tool that produced the output.
+        :param return_code:
+            The exit code of the tool.
+        :param stdout:
+            The buffered standard output of the tool.
+        :param stderr:
+            The buffered standard error of the tool.
+        """
+
+        out, err = asyncio.StreamReader(), asyncio.StreamReader()
+        for stream, data in ((out, stdout), (err, stderr)):
+            stream.feed_data(data)
+            stream.feed_eof()
+
+        async with reporter.start(out, err):
+            pass
+
         return return_code, reporter.annotations, reporter.exceptions
 
 
@@ -152,26 +250,43 @@ def gather_domains(config: BastetConfiguration) -> list[ToolDomain]:
     return [d for d in ToolDomain if d not in config.skip_domains]
 
 
-def gather_tools(domain: ToolDomain, config: BastetConfiguration) -> list[Tool]:
+def enabled_tools(config: BastetConfiguration) -> list[type[Tool]]:
+    """
+    Select all Tools available on the system that are not disabled.
+
+    :param config:
+        The configuration indicating what tools to skip.
+    """
+    return get_available_tools(config.skip_tools)
+
+
+def gather_tools(
+    domain: ToolDomain,
+    config: BastetConfiguration,
+    enabled: list[type[Tool]] | None = None,
+) -> list[Tool]:
     """
     Select all Tools we are going to run in this Bastet run.
 
     This works by:
      - Finding all available tools on the system.
-     - Checking which are used for the selected domain.
      - Removing any disabled by the configuration.
+     - Checking which are used for the selected domain.
 
     :param domain:
         The tool domain to select tools for.
     :param config:
         The configuration options for this bastet run.
+    :param enabled:
+        The result of enabled_tools(config), if already computed.
     """
 
-    return [
-        tool(domain, config.folders)
-        for tool in get_available_tools()
-        if tool.__name__.lower() not in config.skip_tools and domain in tool.domains()
-    ]
+    if enabled is None:
+        enabled = enabled_tools(config)
+
+    folders = config.folders
+
+    return [tool(domain, folders) for tool in enabled if domain in tool.domains()]
 
 
 __all__ = ["ReportHandler", "BastetRunner"]
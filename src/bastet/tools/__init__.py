@@ -6,37 +6,68 @@
 Helper for locating all available tools.
 
 This currently just returns a hard-coded list.
+
+The modules defining the tools are only imported when a tool is requested,
+either through get_available_tools or as an attribute of this package.
 """
 
 from __future__ import annotations as _future_annotations
 
-from .audit import Bandit
+from collections.abc import Collection
+
+import importlib
+
 from .exceptions import ToolError
-from .format import Black, ISort, Ruff
-from .lint import Flake8, MyPy, PyLint
-from .reuse import Reuse
-from .test import PyTest
 from .tool import Annotation, Status, Tool, ToolDomain, ToolResult, ToolResults
 
+# The available tools, in the order they are run, and the module defining each.
+_TOOL_MODULES = {
+    "Reuse": ".reuse",
+    "Ruff": ".format",
+    "ISort": ".format",
+    "Black": ".format",
+    "MyPy": ".lint",
+    "DMyPy": ".lint",
+    "Flake8": ".lint",
+    "PyLint": ".lint",
+    "Bandit": ".audit",
+    "PyTest": ".test",
+}
+
 
-def get_available_tools() -> list[type[Tool]]:
+def get_available_tools(skip: Collection[str] = ()) -> list[type[Tool]]:
     """
     Helper for locating all available tools.
 
     This currently just returns a hard-coded list.
     TODO: Implement this properly.
+
+    :param skip:
+        Lower-case names of tools to leave out. Their modules are not imported
+        unless another tool needs them.
+    """
+    return [_load_tool(name) for name in _TOOL_MODULES if name.lower() not in skip]
+
+
+def _load_tool(name: str) -> type[Tool]:
     """
-    return [
-        Reuse,
-        Ruff,
-        ISort,
-        Black,
-        MyPy,
-        Flake8,
-        PyLint,
-        Bandit,
-        PyTest,
-    ]
+    Import the module for a tool, and return the tool's class.
+    """
+
+    tool: type[Tool] = getattr(importlib.import_module(_TOOL_MODULES[name], __name__), name)
+    return tool
+
+
+def __getattr__(name: str) -> type[Tool]:
+    """
+    Lazily import tool classes accessed as attributes of this package.
+    """
+
+    if name in _TOOL_MODULES:
+        return _load_tool(name)
+
+    error = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(error)
 
 
 __all__ = [
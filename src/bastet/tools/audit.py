@@ -85,7 +85,7 @@ class Bandit(Tool):
 
             yield Annotation(
                 Status.ISSUE,
-                (pathlib.Path(problem["filename"]), problem["line_number"], problem["col_offset"]),
+                (problem["filename"], problem["line_number"], problem["col_offset"]),
                 problem["test_id"],
                 problem["issue_text"],
                 (
@@ -104,7 +104,7 @@ class Bandit(Tool):
             if not sum(metrics.values()):
                 yield Annotation(
                     Status.PASSED,
-                    pathlib.Path(file),
+                    file,
                     "pass",
                     "All bandit checks passed",
                 )
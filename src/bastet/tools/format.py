@@ -16,7 +16,7 @@ import pathlib
 from asyncio import StreamReader
 
 from .exceptions import OutputParsingError, ToolError
-from .tool import Annotation, Status, Tool, ToolDomain
+from .tool import Annotation, Status, Tool, ToolDomain, read_lines
 
 
 class Ruff(Tool):
@@ -98,10 +98,8 @@ class Ruff(Tool):
             await data.read()
             return
 
-        while not data.at_eof():
-            line = await data.readline()
-
-            if not line:
+        async for line in read_lines(data):
+            if not line.strip():
                 continue
 
             try:
@@ -110,13 +108,11 @@ class Ruff(Tool):
                 yield OutputParsingError(data=line.decode(), cause=e)
                 continue
 
+            location = info["location"]
+
             yield Annotation(
                 Status.ISSUE,
-                (
-                    pathlib.Path(info["filename"]),
-                    info["location"]["row"],
-                    info["location"]["column"],
-                ),
+                (info["filename"], location["row"], location["column"]),
                 info["code"],
                 info["message"],
             )
@@ -145,9 +141,10 @@ class _DiffProcessorMixin(Tool):
         """
 
         last_annotation: Annotation | None = None
+        lines = read_lines(data)
 
-        while not data.at_eof():
-            line = (await data.readline()).decode("utf-8", errors="replace")
+        async for raw in lines:
+            line = raw.decode("utf-8", errors="replace")
 
             if line.startswith("error: "):
                 yield self._tokenize_error(line)
@@ -159,8 +156,8 @@ class _DiffProcessorMixin(Tool):
 
                 filename = line.removeprefix("--- ").partition("\t")[0]
                 file = pathlib.Path(filename.removesuffix(":before"))
-                await data.readline()  # Skip the +++ line.
-                line = (await data.readline()).decode("utf-8", errors="replace")
+                await anext(lines, b"")  # Skip the +++ line.
+                line = (await anext(lines, b"")).decode("utf-8", errors="replace")
                 last_annotation = self._diff_header_to_annotation(file, line)
 
             elif last_annotation and line.startswith("@@ "):
@@ -299,9 +296,16 @@ class Black(_DiffProcessorMixin):
         if not error.startswith("cannot format "):
             return OutputParsingError(expected="cannot format", data=error)
 
-        file, reason, line, char, _ = error.removeprefix("cannot format ").split(":", 4)
+        # Splitting on ": " leaves colons in the path (such as drive letters) intact.
+        file, _, rest = error.removeprefix("cannot format ").partition(": ")
+        reason, _, rest = rest.partition(": ")
+        line, _, rest = rest.partition(":")
+        char, _, _ = rest.partition(":")
+
+        if not (line.strip().isdigit() and char.strip().isdigit()):
+            return OutputParsingError(expected="file: reason: line:char", data=error)
 
-        source = pathlib.Path(file.strip()), int(line.strip()), int(char.strip())
+        source = pathlib.Path(file.strip()), int(line), int(char)
 
         return Annotation(
             Status.EXCEPTION,
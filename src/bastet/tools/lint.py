@@ -19,9 +19,27 @@ import abc
 import asyncio
 import os
 import pathlib
+import re
 
 from .exceptions import OutputParsingError, ToolError
-from .tool import Annotation, Status, Tool, ToolDomain
+from .tool import Annotation, Status, Tool, ToolDomain, read_lines
+
+# Status messages from the mypy daemon, which are not annotations.
+_DAEMON_MESSAGES = (b"Daemon ", b"Restarting: ")
+
+# Report banners and the score line from pylint, which are not annotations.
+_PYLINT_BANNERS = ("*" * 10, "-" * 10, "Your code has been rated")
+
+# "file:line:column: CODE message", as output by pylint and flake8.
+_PYLINT_LINE = re.compile(
+    r"\s*(?P<file>[^:]*):(?P<line>\d+):(?P<col>\d+):\s*(?P<code>\S*)\s*(?P<error>.*)",
+)
+
+# "file:line: level: message  [code]", as output by mypy.
+_MYPY_LINE = re.compile(
+    r"(?P<file>[^:]*):(?P<line>\d+):\s*(?P<level>[^:]*):\s*(?P<error>.*?)"
+    r"(?:\s\s\[(?P<code>[^]]*)\])?\s*$",
+)
 
 
 class _PylintOutputMixin(Tool, abc.ABC):
@@ -31,8 +49,8 @@ class _PylintOutputMixin(Tool, abc.ABC):
         self,
         data: asyncio.StreamReader,
     ) -> AsyncIterable[Annotation | ToolError]:
-        while not data.at_eof():
-            line = (await data.readline()).decode("utf-8", errors="replace")
+        async for raw in read_lines(data):
+            line = raw.decode("utf-8", errors="replace")
 
             if line.startswith("[Errno"):
                 code, _, error = line.partition("] ")
@@ -40,7 +58,7 @@ class _PylintOutputMixin(Tool, abc.ABC):
                 yield Annotation(Status.EXCEPTION, None, code, error)
                 continue
 
-            if line.startswith(("*" * 10, "-" * 10, "Your code has been rated")):
+            if line.startswith(_PYLINT_BANNERS):
                 continue
 
             if to_yield := self._process_line(line):
@@ -52,24 +70,22 @@ class _PylintOutputMixin(Tool, abc.ABC):
     def _process_line(self, line: str) -> Annotation | ToolError | None:
         annotation = self._annotation
 
-        try:
-            file, line_no, col, error = line.strip().split(":", 3)
-        except ValueError:
+        # Lines that are not annotations, such as the code quoted by duplicate-code,
+        # add context to the previous annotation.
+        if not (match := _PYLINT_LINE.match(line)):
             if self._annotation:
                 self._annotation.add_note(line)
             return None
 
-        try:
-            source = (pathlib.Path(file), int(line_no), int(col))
-
-            code, _, error = error.strip().partition(" ")
-            code = code.strip(":")
-
-            # Start a new annotation
-            self._annotation = Annotation(Status.ISSUE, source, code, error)
+        source = (match["file"], int(match["line"]), int(match["col"]))
 
-        except ValueError as e:
-            return OutputParsingError(data=line, cause=e)
+        # Start a new annotation
+        self._annotation = Annotation(
+            Status.ISSUE,
+            source,
+            match["code"].strip(":"),
+            match["error"],
+        )
 
         # Return the previous complete annotation (if there was one)
         return annotation
@@ -141,11 +157,19 @@ class MyPy(Tool):
         In order to handle namespace packages, we pass MyPy the list
         of concrete module paths, and set MYPYPATH environment variable.
         See the get_environment function for more details.
+
+        The incremental cache is kept in the project root, regardless of the
+        working directory, so that it is re-used between runs and can be
+        persisted by CI. The SQLite cache is a handful of files rather than
+        one per module, which is much faster to save and restore.
         """
         return [
             "mypy",
             "--strict",
             "--explicit-package-bases",
+            "--cache-dir",
+            self._paths.root_path / ".mypy_cache",
+            "--sqlite-cache",
             *self._paths.python_module_path,
         ]
 
@@ -188,36 +212,65 @@ class MyPy(Tool):
 
         last_annotation: Annotation | None = None
 
-        while not data.at_eof():
-            line = (await data.readline()).decode("utf-8", errors="replace")
-
-            if ":" not in line or "Success:" in line:
+        async for raw in read_lines(data):
+            # Skip summary and daemon status lines without decoding them.
+            if b":" not in raw or b"Success:" in raw or raw.startswith(_DAEMON_MESSAGES):
                 continue
 
-            try:
-                file, line_str, level, error = line.strip().split(":", 3)
+            line = raw.decode("utf-8", errors="replace")
 
-                source = (pathlib.Path(file), int(line_str), 0)
-                level = level.strip()
+            if not (match := _MYPY_LINE.match(line)):
+                yield OutputParsingError("Unable to read file/line number", line)
+                continue
 
-                if last_annotation:
-                    if level == "note" and last_annotation.same_source(source):
-                        last_annotation.add_note(error)
-                        continue
+            source = (match["file"], int(match["line"]), 0)
 
-                    yield last_annotation
+            if last_annotation:
+                if match["level"] == "note" and last_annotation.same_source(source):
+                    last_annotation.add_note(match["error"])
+                    continue
 
-                error, _, code = error.rpartition("  ")
-                code = code.strip("[]")
+                yield last_annotation
 
-                last_annotation = Annotation(Status.ISSUE, source, code, error)
-            except ValueError as e:
-                yield OutputParsingError("Unable to read file/line number", line, e)
+            last_annotation = Annotation(
+                Status.ISSUE,
+                source,
+                match["code"] or "",
+                match["error"],
+            )
 
         if last_annotation:
             yield last_annotation
 
 
+class DMyPy(MyPy):
+    """
+    Runs 'mypy' through its daemon, 'dmypy'.
+
+    The daemon keeps the analysis of the code base in memory between runs,
+    so only changed files are re-checked. It is started on the first run,
+    and shuts itself down after an hour of inactivity.
+    """
+
+    def get_command(self) -> list[str | pathlib.Path]:
+        """
+        Command string to execute (including arguments).
+
+        The daemon's status file is kept in the project root, so that each
+        project has its own daemon.
+        """
+        return [
+            "dmypy",
+            "--status-file",
+            self._paths.root_path / ".dmypy.json",
+            "run",
+            "--timeout",
+            "3600",
+            "--",
+            *super().get_command()[1:],
+        ]
+
+
 class PyLint(_PylintOutputMixin, Tool):
     """
     Runs 'pylint', the canonical python linter.
@@ -237,9 +290,12 @@ class PyLint(_PylintOutputMixin, Tool):
     def get_command(self) -> list[str | pathlib.Path]:
         """
         Command string to execute (including arguments).
+
+        pylint's analysis is CPU bound, so it is run with one worker per core.
         """
         return [
             "pylint",
+            "--jobs=0",
             "--ignore-paths",
             ",".join(
                 [str(x) for x in self._paths.exclude_dirs],
@@ -11,12 +11,13 @@ from __future__ import annotations as _future_annotations
 from collections.abc import AsyncIterable, Iterator
 
 import asyncio
+import functools
 import itertools
 import json
 import pathlib
 
 from .exceptions import OutputParsingError, ToolError
-from .tool import Annotation, Status, Tool, ToolDomain
+from .tool import Annotation, Status, Tool, ToolDomain, read_lines
 
 _COPYRIGHT_FILE = pathlib.Path("copyright.json")
 _LICENSE_DIR = pathlib.Path("LICENSES")
@@ -55,10 +56,8 @@ class Reuse(Tool):
             self._paths.root_path,
             "annotate",
             "--merge-copyrights",
-            "--copyright" if _copyright else "",
-            _copyright if _copyright else "",
-            "--license" if _license else "",
-            _license if _license else "",
+            *(("--copyright", _copyright) if _copyright else ()),
+            *(("--license", _license) if _license else ()),
             "--skip-unrecognised",
             "--skip-existing",
             "--recursive",
@@ -126,7 +125,7 @@ class Reuse(Tool):
         Process the output of the `reuse annotate` command.
         """
 
-        while line := await data.readline():
+        async for line in read_lines(data):
             if info := _with_prefix_and_note(line, b"Skipped file "):
                 yield Annotation(Status.PASSED, (info[0], None, None), "reuse", info[1])
                 continue
@@ -154,7 +153,8 @@ class Reuse(Tool):
         """
         output = json.loads(await data.read())
 
-        passed = {pathlib.Path(file["path"]) for file in output["files"]}
+        # Paths are kept as reported by reuse, and only become Paths in annotations.
+        passed: set[str] = {file["path"] for file in output["files"]}
         issues = output["non_compliant"]
 
         for note in itertools.chain(
@@ -170,7 +170,7 @@ class Reuse(Tool):
     @staticmethod
     def _requested_license_issues(
         issues: dict[str, dict[str, list[str]]],
-        passed: set[pathlib.Path],
+        passed: set[str],
     ) -> Iterator[Annotation]:
         """
         Annotations related to extra/missing licenses in the LICENSES folder.
@@ -184,7 +184,7 @@ class Reuse(Tool):
                 f"Bad license {name}",
                 f"Referenced in {' '.join(files)}",
             )
-            passed.difference_update({pathlib.Path(file) for file in files})
+            passed.difference_update(files)
 
         for name, files in issues["missing_licenses"].items():
             file = _LICENSE_DIR / f"{name}.txt"
@@ -195,7 +195,7 @@ class Reuse(Tool):
                 f"Missing license {name}",
                 f"Referenced in {' '.join(files)}",
             )
-            passed.difference_update({pathlib.Path(file) for file in files})
+            passed.difference_update(files)
 
     @staticmethod
     def _license_issues(
@@ -233,28 +233,28 @@ class Reuse(Tool):
     @staticmethod
     def _spdx_issues(
         issues: dict[str, list[str]],
-        passed: set[pathlib.Path],
+        passed: set[str],
     ) -> Iterator[Annotation]:
         """
         Annotations for files missing license or copyright information.
         """
 
         for file_name in issues["missing_copyright_info"]:
-            file = pathlib.Path(file_name)
-            yield Annotation(Status.ISSUE, file, "no-copyright", "No SPDX copyright line")
-            passed.discard(file)
+            yield Annotation(Status.ISSUE, file_name, "no-copyright", "No SPDX copyright line")
+            passed.discard(file_name)
 
         for file_name in issues["missing_licensing_info"]:
-            file = pathlib.Path(file_name)
-            yield Annotation(Status.ISSUE, file, "no-license", "No SPDX license line")
-            passed.discard(file)
+            yield Annotation(Status.ISSUE, file_name, "no-license", "No SPDX license line")
+            passed.discard(file_name)
 
 
+@functools.lru_cache(maxsize=4)
 def load_copyright_file(root: pathlib.Path) -> tuple[str | None, str | None]:
     """
     Attempts to load a copyright.json standard from the cwd.
 
-    If there is one.
+    If there is one. The file is read once per root, as both the command
+    and the results processing of each reuse run need it.
     :return:
     """
     if not (root / _COPYRIGHT_FILE).exists():
@@ -86,8 +86,8 @@ class PyTest(Tool):
         This actually just throws the output away, then reads the junit XML
         and processes that instead.
         """
-        while not data.at_eof():
-            await data.read(1024)
+        while await data.read(65536):
+            pass
 
         tree = defusedxml.ElementTree.parse(self._paths.report_path / "junit-test.xml")
         for annotation in self._process_junit(tree.getroot()):
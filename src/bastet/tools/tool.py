@@ -8,13 +8,15 @@ Support classes for running a series of tools across a codebase.
 
 from __future__ import annotations as _future_annotations
 
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, AsyncIterator
 from typing import NamedTuple
 
 import abc
 import asyncio
 import dataclasses
 import enum
+import functools
+import os
 import pathlib
 from collections import Counter  # pylint: disable=ungrouped-imports
 
@@ -70,17 +72,19 @@ class Status(enum.Enum):
     ISSUE = "Failed"
     EXCEPTION = "Error"
 
+    _rank: int
+
     def __lt__(self, other: Status) -> bool:
         """
         Total ordering for Status enum.
         """
-        return _STATUS_ORDERING[self] < _STATUS_ORDERING[other]
+        return self._rank < other._rank
 
     def __gt__(self, other: Status) -> bool:
         """
         Total ordering for Status enum.
         """
-        return _STATUS_ORDERING[self] > _STATUS_ORDERING[other]
+        return self._rank > other._rank
 
     def __ge__(self, other: Status) -> bool:
         """
@@ -89,7 +93,10 @@ class Status(enum.Enum):
         return other == self or self.__gt__(other)
 
 
-_STATUS_ORDERING = {name: idx for idx, name in enumerate(Status)}
+# Store each status's position on the member itself, so comparisons read an
+# attribute instead of hashing both members (enum hashing is pure Python).
+for _rank, _status in enumerate(Status):
+    _status._rank = _rank  # pylint: disable=protected-access # noqa: SLF001 - set once here.
 
 
 class ToolResult(NamedTuple):
@@ -307,6 +314,20 @@ class ToolResults:  # pylint: disable=too-few-public-methods
         self.results[tool] = ToolResult(status, exit_code, annotation_levels)
 
 
+@functools.lru_cache(maxsize=4096)
+def _absolute(path: pathlib.Path | str, cwd: str) -> pathlib.Path:
+    """
+    Make a path absolute, caching the result for paths reported many times.
+
+    The working directory is part of the cache key, so relative paths are
+    still resolved correctly if it changes.
+    """
+
+    path = pathlib.Path(path)
+
+    return path if path.is_absolute() else pathlib.Path(cwd, path)
+
+
 @dataclasses.dataclass
 class Annotation:
     """
@@ -356,16 +377,13 @@ class Annotation:
         if not source:
             return cls._CWD, 0, 0
 
-        if isinstance(source, str):
-            source = pathlib.Path(source)
-
-        if isinstance(source, pathlib.Path):
-            return source.absolute(), 0, 0
+        # A str is a cheaper cache key for _absolute than a Path.
+        cwd = os.getcwd()  # noqa: PTH109
 
-        if isinstance(source[0], str):
-            return pathlib.Path(source[0]).absolute(), source[1] or 0, source[2] or 0
+        if isinstance(source, str | pathlib.Path):
+            return _absolute(source, cwd), 0, 0
 
-        return source[0].absolute(), source[1] or 0, source[2] or 0
+        return _absolute(source[0], cwd), source[1] or 0, source[2] or 0
 
     status: Status
     source: tuple[pathlib.Path, int, int]
@@ -412,18 +430,17 @@ class Annotation:
         self.description = description.strip() if description else None
         self.diff = None
 
-    @property
+    @functools.cached_property
     def filename(self) -> str:
         """
         Returns the filename of the annotation relative to the project root.
 
         This does not include the line number.
         If the path is the project root, '.' is returned.
+        The result is computed once, as each reporter may ask for it.
         """
 
-        root = self._CWD
-
-        if self.source[0] == root:
+        if self.source[0] == self._CWD:
             return "."
 
         return str(self.source[0].relative_to(self._CWD))
@@ -436,12 +453,11 @@ class Annotation:
         The returned string is relative to the project root (which many UIs will
         convert into a link). If the path is the project root, it returns just '[project]'.
         """
-        root = self._CWD
 
-        if self.source[0] == root:
-            return "[project]"
+        file = self.filename
 
-        file = str(self.source[0].relative_to(self._CWD))
+        if file == ".":
+            return "[project]"
 
         if not self.source[1]:
             return file
@@ -472,7 +488,10 @@ class Annotation:
 
         return self.source < other.source
 
-    def same_source(self, source: tuple[pathlib.Path, int | None, int | None] | None) -> bool:
+    def same_source(
+        self,
+        source: tuple[pathlib.Path | str, int | None, int | None] | None,
+    ) -> bool:
         """
         Check if another Annotation source normalises to this Annotation's source.
         """
@@ -535,3 +554,22 @@ class PathRepo:
     python_path: frozenset[pathlib.Path]
     python_files: frozenset[pathlib.Path]
     python_module_path: frozenset[pathlib.Path]
+
+
+async def read_lines(data: asyncio.StreamReader, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+    """
+    Iterate over the lines of a stream, reading it in large chunks.
+
+    Each line keeps its trailing newline, except for a final unterminated line.
+    """
+
+    pending = b""
+
+    while chunk := await data.read(chunk_size):
+        *lines, pending = (pending + chunk).split(b"\n")
+
+        for line in lines:
+            yield line + b"\n"
+
+    if pending:
+        yield pending
@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2024 Mewbot Developers <mewbot@quicksilver.london>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""
+Shared fixtures for the Bastet tests.
+"""
+
+from __future__ import annotations as _future_annotations
+
+import asyncio
+import pathlib
+
+import pytest
+from bastet.tools import Annotation, Tool, ToolDomain, ToolError
+from bastet.tools.tool import PathRepo
+
+ROOT = pathlib.Path(__file__).parent
+FILE = ROOT / "a.py"
+
+PATHS = PathRepo(ROOT, ROOT, frozenset(), frozenset(), frozenset(), frozenset())
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _annotation_root() -> None:
+    """Ensure annotation paths are calculated relative to the test directory."""
+    Annotation.set_root(ROOT)
+
+
+async def parse_output(tool: type[Tool], output: str) -> list[Annotation | ToolError]:
+    """Run a tool's output parser over some captured output."""
+
+    stream = asyncio.StreamReader()
+    stream.feed_data(output.encode("utf-8"))
+    stream.feed_eof()
+
+    return [item async for item in tool(ToolDomain.LINT, PATHS).process_results(stream)]
@@ -13,51 +13,67 @@ import pathlib
 import pytest
 from bastet.tools import Annotation, Status
 
-from .util import ParameterSet
-
 SELF = pathlib.Path(__file__)
 SELF_NAME = SELF.name
 ROOT = SELF.parent
 
 
-DATASET_NORMALISE_SOURCE = [
-    ParameterSet([None, (ROOT, 0, 0)], [], "root"),
-    ParameterSet([ROOT, (ROOT, 0, 0)], [], "root-path"),
-    ParameterSet([__file__, (SELF, 0, 0)], [], "file"),
-    ParameterSet([pathlib.Path(__file__), (SELF, 0, 0)], [], "path"),
-    ParameterSet([(__file__, None, None), (SELF, 0, 0)], [], "file-no-line"),
-    ParameterSet([(__file__, 1, None), (SELF, 1, 0)], [], "file-line"),
-    ParameterSet([(__file__, 1, 0), (SELF, 1, 0)], [], "file-line"),
-    ParameterSet([(__file__, -1, 0), (SELF, -1, 0)], [], "file-line"),
-    ParameterSet([(__file__, 1, 1), (SELF, 1, 1)], [], "file-line"),
-    ParameterSet([(pathlib.Path(__file__), 1, 0), (SELF, 1, 0)], [], "file-line"),
+Source = tuple[pathlib.Path | str, int | None, int | None] | str | pathlib.Path | None
+
+# The source inputs shared by all the datasets below, with their test ids.
+SOURCES: list[tuple[str, Source]] = [
+    ("root", None),
+    ("root-path", ROOT),
+    ("file", __file__),
+    ("path", SELF),
+    ("file-no-line", (__file__, None, None)),
+    ("file-line", (__file__, 1, None)),
+    ("file-line-col-0", (__file__, 1, 0)),
+    ("file-negative-line", (__file__, -1, 0)),
+    ("file-line-col", (__file__, 1, 1)),
+    ("path-line", (SELF, 1, 0)),
 ]
 
-DATASET_TEST_FILENAME = [
-    ParameterSet([None, "."], [], "root"),
-    ParameterSet([ROOT, "."], [], "root-path"),
-    ParameterSet([__file__, SELF_NAME], [], "file"),
-    ParameterSet([pathlib.Path(__file__), SELF_NAME], [], "path"),
-    ParameterSet([(__file__, None, None), SELF_NAME], [], "file-no-line"),
-    ParameterSet([(__file__, 1, None), SELF_NAME], [], "file-line"),
-    ParameterSet([(__file__, 1, 0), SELF_NAME], [], "file-line"),
-    ParameterSet([(__file__, -1, 0), SELF_NAME], [], "file-line"),
-    ParameterSet([(__file__, 1, 1), SELF_NAME], [], "file-line"),
-    ParameterSet([(pathlib.Path(__file__), 1, 0), SELF_NAME], [], "file-line"),
-]
 
-DATASET_TEST_FILESTR = [
-    ParameterSet([None, "[project]"], [], "root"),
-    ParameterSet([ROOT, "[project]"], [], "root-path"),
-    ParameterSet([__file__, SELF_NAME], [], "file"),
-    ParameterSet([pathlib.Path(__file__), SELF_NAME], [], "path"),
-    ParameterSet([(__file__, None, None), SELF_NAME], [], "file-no-line"),
-    ParameterSet([(__file__, 1, None), f"{SELF_NAME}:1"], [], "file-line"),
-    ParameterSet([(__file__, 1, 0), f"{SELF_NAME}:1"], [], "file-line"),
-    ParameterSet([(__file__, -1, 0), f"{SELF_NAME}:-1"], [], "file-line"),
-    ParameterSet([(__file__, 1, 1), f"{SELF_NAME}:1"], [], "file-line"),
-    ParameterSet([(pathlib.Path(__file__), 1, 0), f"{SELF_NAME}:1"], [], "file-line"),
-]
+def _dataset(expected: list[object]) -> list[object]:
+    """Pair each of the SOURCES with its expected value."""
+    return [
+        pytest.param(source, value, id=source_id)
+        for (source_id, source), value in zip(SOURCES, expected, strict=True)
+    ]
+
+
+DATASET_NORMALISE_SOURCE = _dataset(
+    [
+        (ROOT, 0, 0),
+        (ROOT, 0, 0),
+        (SELF, 0, 0),
+        (SELF, 0, 0),
+        (SELF, 0, 0),
+        (SELF, 1, 0),
+        (SELF, 1, 0),
+        (SELF, -1, 0),
+        (SELF, 1, 1),
+        (SELF, 1, 0),
+    ],
+)
+
+DATASET_TEST_FILENAME = _dataset([".", ".", *[SELF_NAME] * 8])
+
+DATASET_TEST_FILESTR = _dataset(
+    [
+        "[project]",
+        "[project]",
+        SELF_NAME,
+        SELF_NAME,
+        SELF_NAME,
+        f"{SELF_NAME}:1",
+        f"{SELF_NAME}:1",
+        f"{SELF_NAME}:-1",
+        f"{SELF_NAME}:1",
+        f"{SELF_NAME}:1",
+    ],
+)
 
 
 class TestAnnotations:
@@ -65,11 +81,6 @@ class TestAnnotations:
     Tests for the Annotations class.
     """
 
-    @classmethod
-    def setup_class(cls) -> None:
-        """Ensure annotation paths are calculated relative to this file's directory."""
-        Annotation.set_root(ROOT)
-
     def test_trivial_init(self) -> None:
         """
         Test the dataclass constructor of Annotation for coverage purposes.
@@ -86,17 +97,29 @@ class TestAnnotations:
     @pytest.mark.parametrize(("source", "expected"), DATASET_NORMALISE_SOURCE)
     def test_normalise_source(
         self,
-        source: tuple[pathlib.Path | str, int | None, int | None] | str | pathlib.Path | None,
+        source: Source,
         expected: tuple[pathlib.Path, int, int],
     ) -> None:
         """Test cases for the `Annotation._normalise_source` method."""
         normalised_source = Annotation._normalise_source(source)
         assert normalised_source == expected
 
+    def test_normalise_relative_source(
+        self,
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Relative sources are resolved against the current working directory."""
+
+        for folder in (tmp_path / "a", tmp_path / "b"):
+            folder.mkdir()
+            monkeypatch.chdir(folder)
+            assert Annotation(Status.PASSED, "x.py", "", "").source == (folder / "x.py", 0, 0)
+
     @pytest.mark.parametrize(("source", "expected"), DATASET_TEST_FILENAME)
     def test_filename(
         self,
-        source: tuple[pathlib.Path | str, int | None, int | None] | str | pathlib.Path | None,
+        source: Source,
         expected: str,
     ) -> None:
         """Test cases for the `Annotation.filename` method."""
@@ -106,7 +129,7 @@ class TestAnnotations:
     @pytest.mark.parametrize(("source", "expected"), DATASET_TEST_FILESTR)
     def test_filestr(
         self,
-        source: tuple[pathlib.Path | str, int | None, int | None] | str | pathlib.Path | None,
+        source: Source,
         expected: str,
     ) -> None:
         """Test cases for the `Annotation.filestr` method."""
@@ -0,0 +1,248 @@
+# SPDX-FileCopyrightText: 2024 Mewbot Developers <mewbot@quicksilver.london>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""
+Tests for the path discovery in the Bastet configuration.
+"""
+
+from __future__ import annotations as _future_annotations
+
+import argparse
+import logging
+import pathlib
+
+import pytest
+from bastet.config import (
+    BastetConfiguration,
+    PathGatherer,
+    _find_pyproject,
+    _tools_or_domains,
+    add_options,
+)
+from bastet.tools.tool import PathRepo, ToolDomain
+
+LOGGER = logging.getLogger("bastet.tests")
+
+
+def _touch(root: pathlib.Path, *files: str) -> None:
+    for file in files:
+        path = root / file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+
+@pytest.fixture(name="project")
+def _project(tmp_path: pathlib.Path) -> pathlib.Path:
+    """
+    A small src-layout project with some ignored content.
+    """
+
+    _touch(
+        tmp_path,
+        "src/package/__init__.py",
+        "src/package/module.py",
+        "src/package/sub/__init__.py",
+        "src/package/sub/leaf.py",
+        "src/namespace/inner/__init__.py",
+        "tests/test_thing.py",
+        "build/lib/package/__init__.py",
+        "node_modules/thing/script.py",
+        ".git/hooks/hook.py",
+        "src/package/generated/__init__.py",
+        "src/package/skipped.py",
+    )
+
+    (tmp_path / ".gitignore").write_text("build/\nnode_modules/\n", encoding="utf-8")
+    (tmp_path / "src" / "package" / ".gitignore").write_text(
+        "generated/\nskipped.py\n",
+        encoding="utf-8",
+    )
+
+    return tmp_path
+
+
+def _gather(root: pathlib.Path, exclude: list[str] | None = None) -> PathRepo:
+    return PathGatherer(LOGGER, root, []).gather(exclude or [], {"src", "tests"})
+
+
+class TestPathGatherer:
+    """
+    Tests for the PathGatherer class.
+    """
+
+    def test_python_path(self, project: pathlib.Path) -> None:
+        """The 'src' and 'tests' folders are detected as PYTHON_PATH entries."""
+
+        folders = _gather(project)
+
+        assert folders.python_path == {project / "src", project / "tests"}
+
+    def test_python_path_root_file(self, tmp_path: pathlib.Path) -> None:
+        """A python file in the project root does not hide the 'src' folder."""
+
+        _touch(tmp_path, "pyproject.toml", "setup.py", "src/pkg/__init__.py")
+        (tmp_path / "tests").mkdir()
+
+        folders = _gather(tmp_path)
+
+        assert folders.python_path == {tmp_path, tmp_path / "src"}
+
+    def test_module_path(self, project: pathlib.Path) -> None:
+        """Module roots are the highest folders containing python files."""
+
+        folders = _gather(project)
+
+        assert folders.python_module_path == {
+            project / "src" / "package",
+            project / "src" / "namespace" / "inner",
+            project / "tests",
+        }
+
+    def test_python_files(self, project: pathlib.Path) -> None:
+        """Ignored files and folders do not contribute python files."""
+
+        folders = _gather(project)
+
+        assert folders.python_files == {
+            project / "src" / "package" / "__init__.py",
+            project / "src" / "package" / "module.py",
+            project / "src" / "package" / "sub" / "__init__.py",
+            project / "src" / "package" / "sub" / "leaf.py",
+            project / "src" / "namespace" / "inner" / "__init__.py",
+            project / "tests" / "test_thing.py",
+        }
+
+    def test_exclusions(self, project: pathlib.Path) -> None:
+        """Ignored folders, including version control folders, are recorded as excluded."""
+
+        folders = _gather(project)
+
+        assert folders.exclude_dirs == {
+            project / ".git",
+            project / "build",
+            project / "node_modules",
+            project / "src" / "package" / "generated",
+        }
+        assert project / "node_modules" / "thing" / "script.py" not in folders.python_files
+
+    def test_gitignore_directory(self, project: pathlib.Path) -> None:
+        """A folder named '.gitignore' is scanned, not parsed as ignore rules."""
+
+        _touch(project, "tests/.gitignore/helper.py")
+
+        folders = _gather(project)
+
+        assert project / "tests" / ".gitignore" / "helper.py" in folders.python_files
+
+    def test_config_exclusions(self, project: pathlib.Path) -> None:
+        """Exclusions from the configuration are applied relative to the project root."""
+
+        folders = _gather(project, ["/tests/", "module.py"])
+
+        assert project / "tests" in folders.exclude_dirs
+        assert project / "tests" not in folders.python_path
+        assert project / "src" / "package" / "module.py" not in folders.python_files
+
+
+class TestFindPyproject:
+    """
+    Tests for locating the project root.
+    """
+
+    def test_nearest_marker(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The closest parent with a pyproject.toml or VCS folder is the root."""
+
+        _touch(tmp_path, "outer/pyproject.toml", "outer/inner/.git/HEAD", "outer/inner/a/b/c.py")
+        monkeypatch.chdir(tmp_path / "outer" / "inner" / "a" / "b")
+
+        assert _find_pyproject(LOGGER) == (tmp_path / "outer" / "inner").resolve()
+
+    def test_marker_type(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A '.git' file (rather than folder) does not mark the root."""
+
+        _touch(tmp_path, "outer/pyproject.toml", "outer/inner/.git")
+        monkeypatch.chdir(tmp_path / "outer" / "inner")
+
+        assert _find_pyproject(LOGGER) == (tmp_path / "outer").resolve()
+
+
+def test_tools_or_domains() -> None:
+    """Config entries are split, case-insensitively, into domains and tool names."""
+
+    domains, tools = _tools_or_domains(["Lint", "AUDIT", "PyLint", "isort"])
+
+    assert domains == {ToolDomain.LINT, ToolDomain.AUDIT}
+    assert tools == {"pylint", "isort"}
+
+
+class TestDisabledTools:
+    """
+    Tests for the tools disabled by default and by the config.
+    """
+
+    @staticmethod
+    def _configure(root: pathlib.Path, *args: str) -> BastetConfiguration:
+        parsed = add_options(argparse.ArgumentParser()).parse_args(["--root", str(root), *args])
+        return BastetConfiguration(LOGGER, parsed)
+
+    def test_default(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without any config, the tools that ruff replaces are disabled."""
+
+        _touch(tmp_path, "pyproject.toml")
+        monkeypatch.chdir(tmp_path)
+
+        assert self._configure(tmp_path).skip_tools == {"isort", "flake8", "dmypy"}
+
+    def test_config(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Setting 'disable' in the config adds to the default."""
+
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.bastet]\ndisable = ["isort", "black"]\n',
+            encoding="utf-8",
+        )
+        monkeypatch.chdir(tmp_path)
+
+        assert self._configure(tmp_path).skip_tools == {"isort", "flake8", "dmypy", "black"}
+        assert self._configure(tmp_path, "--skip", "ruff").skip_tools == {
+            "isort",
+            "flake8",
+            "dmypy",
+            "black",
+            "ruff",
+        }
+
+    def test_enable(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Tools disabled by default run when named in 'enable'."""
+
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.bastet]\ndisable = ["black"]\nenable = ["Flake8"]\n',
+            encoding="utf-8",
+        )
+        monkeypatch.chdir(tmp_path)
+
+        assert self._configure(tmp_path).skip_tools == {"isort", "dmypy", "black"}
+        assert self._configure(tmp_path, "--enable", "isort").skip_tools == {
+            "flake8",
+            "dmypy",
+            "black",
+        }
+
+    def test_dmypy(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The mypy daemon only runs, in place of mypy, when it is enabled."""
+
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.bastet]\ndisable = ["isort"]\n',
+            encoding="utf-8",
+        )
+        monkeypatch.chdir(tmp_path)
+
+        assert {"dmypy"} <= self._configure(tmp_path).skip_tools
+        assert "mypy" not in self._configure(tmp_path).skip_tools
+
+        for args in (("--skip", "mypy"), ("--disable", "MyPy")):
+            assert {"mypy", "dmypy"} <= self._configure(tmp_path, *args).skip_tools
+
+        skipped = self._configure(tmp_path, "--enable", "dmypy").skip_tools
+        assert "mypy" in skipped
+        assert "dmypy" not in skipped
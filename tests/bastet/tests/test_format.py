@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: 2024 Mewbot Developers <mewbot@quicksilver.london>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""
+Tests for parsing the output of the formatting tools.
+"""
+
+from __future__ import annotations as _future_annotations
+
+import json
+import pathlib
+
+import pytest
+from bastet.tools import Annotation
+from bastet.tools.exceptions import OutputParsingError
+from bastet.tools.format import Black, Ruff
+
+from .conftest import FILE, parse_output
+
+
+def _ruff_line(code: str, row: int, column: int, message: str) -> str:
+    return json.dumps(
+        {
+            "code": code,
+            "filename": str(FILE),
+            "location": {"row": row, "column": column},
+            "message": message,
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_ruff() -> None:
+    """Each JSON line from ruff is an annotation."""
+
+    results = await parse_output(
+        Ruff,
+        _ruff_line("E501", 1, 101, "Line too long")
+        + "\n"
+        + _ruff_line("F401", 2, 8, "`os` imported but unused"),
+    )
+
+    assert [(n.source, n.code, n.message) for n in results if isinstance(n, Annotation)] == [
+        ((FILE, 1, 101), "E501", "Line too long"),
+        ((FILE, 2, 8), "F401", "`os` imported but unused"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_black() -> None:
+    """Each block of a diff from black is an annotation, with the block attached."""
+
+    results = await parse_output(
+        Black,
+        f"--- {FILE}\t2024-01-01 00:00:00+00:00\n"
+        f"+++ {FILE}\t2024-01-01 00:00:01+00:00\n"
+        "@@ -1,3 +1,3 @@\n"
+        " x = 1\n"
+        "-y=2\n"
+        "+y = 2\n"
+        "@@ -10,2 +10,2 @@\n"
+        "-z  = 3\n"
+        "+z = 3\n",
+    )
+
+    first, second = results
+    assert isinstance(first, Annotation)
+    assert isinstance(second, Annotation)
+    assert first.source == (FILE, 1, 0)
+    assert first.diff == ["@@ -1,3 +1,3 @@\n", " x = 1\n", "-y=2\n", "+y = 2\n"]
+    assert second.source == (FILE, 10, 0)
+    assert second.diff == ["@@ -10,2 +10,2 @@\n", "-z  = 3\n", "+z = 3\n"]
+
+
+@pytest.mark.parametrize("file", [str(FILE), "C:\\src\\a.py"])
+@pytest.mark.asyncio
+async def test_black_error(file: str) -> None:
+    """Black's parse errors are annotations, including on paths with drive letters."""
+
+    (result,) = await parse_output(
+        Black,
+        f"error: cannot format {file}: Cannot parse: 12:3: x = (\n",
+    )
+
+    assert isinstance(result, Annotation)
+    assert result.source
+    assert result.source[0].name == pathlib.Path(file).name
+    assert result.source[1:] == (12, 3)
+    assert result.message == "Cannot parse"
+
+
+@pytest.mark.asyncio
+async def test_black_unparsable_error() -> None:
+    """Black errors without a position report the whole line."""
+
+    message = f"cannot format {FILE}: INTERNAL ERROR: Black produced invalid code: foo."
+
+    (result,) = await parse_output(Black, f"error: {message}\n")
+
+    assert isinstance(result, OutputParsingError)
+    assert f"Saw: {message}\n" in (result.__notes__ or [])
@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: 2024 Mewbot Developers <mewbot@quicksilver.london>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""
+Tests for parsing the output of the linting tools.
+"""
+
+from __future__ import annotations as _future_annotations
+
+import pytest
+from bastet.tools import Annotation, Status
+from bastet.tools.exceptions import OutputParsingError
+from bastet.tools.lint import Flake8, MyPy, PyLint
+
+from .conftest import FILE, parse_output
+
+
+@pytest.mark.asyncio
+async def test_flake8() -> None:
+    """Each flake8 line is an annotation with a code and message."""
+
+    results = await parse_output(
+        Flake8,
+        f"{FILE}:1:2: E501 line too long (101 > 100 characters)\n{FILE}:3:4: F401 'os' imported\n",
+    )
+
+    assert [(n.source, n.code, n.message) for n in results if isinstance(n, Annotation)] == [
+        ((FILE, 1, 2), "E501", "line too long (101 > 100 characters)"),
+        ((FILE, 3, 4), "F401", "'os' imported"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_pylint() -> None:
+    """Pylint headers are skipped, and unstructured lines become notes."""
+
+    results = await parse_output(
+        PyLint,
+        "************* Module a\n"
+        f"{FILE}:10:0: R0801: Similar lines in 2 files\n"
+        "==a:[1:5]\n"
+        "==b:[2:6]\n"
+        f"{FILE}:12:4: C0103: Bad name (invalid-name)\n"
+        "-----------------------------------\n"
+        "Your code has been rated at 9.00/10\n",
+    )
+
+    first, second = results
+    assert isinstance(first, Annotation)
+    assert isinstance(second, Annotation)
+    assert (first.source, first.code, first.message) == (
+        (FILE, 10, 0),
+        "R0801",
+        "Similar lines in 2 files",
+    )
+    assert first.description == "==a:[1:5]\n==b:[2:6]"
+    assert (second.source, second.code, second.message) == (
+        (FILE, 12, 4),
+        "C0103",
+        "Bad name (invalid-name)",
+    )
+
+
+@pytest.mark.asyncio
+async def test_pylint_duplicate_code() -> None:
+    """Quoted code containing colons is context for the duplicate-code annotation."""
+
+    results = await parse_output(
+        PyLint,
+        f"{FILE}:1:0: R0801: Similar lines in 2 files\n"
+        "==a:[10:20]\n"
+        "async def _parse(tool: type[Tool], output: str) -> list[Annotation | ToolError]:\n",
+    )
+
+    (result,) = results
+    assert isinstance(result, Annotation)
+    assert result.code == "R0801"
+    assert result.description == (
+        "==a:[10:20]\n"
+        "async def _parse(tool: type[Tool], output: str) -> list[Annotation | ToolError]:"
+    )
+
+
+@pytest.mark.asyncio
+async def test_mypy() -> None:
+    """MyPy notes are merged into the preceding error on the same line."""
+
+    results = await parse_output(
+        MyPy,
+        f"{FILE}:1: error: Library stubs not installed for 'x'  [import-untyped]\n"
+        f"{FILE}:1: note: Hint: install the stubs\n"
+        f"{FILE}:2: error: Missing return  [return]\n"
+        "Found 2 errors in 1 file (checked 1 source file)\n",
+    )
+
+    first, second = results
+    assert isinstance(first, Annotation)
+    assert isinstance(second, Annotation)
+    assert (first.source, first.code, first.message, first.status) == (
+        (FILE, 1, 0),
+        "import-untyped",
+        "Library stubs not installed for 'x'",
+        Status.ISSUE,
+    )
+    assert first.description
+    assert first.description.strip() == "Hint: install the stubs"
+    assert (second.source, second.code, second.message) == (
+        (FILE, 2, 0),
+        "return",
+        "Missing return",
+    )
+
+
+@pytest.mark.asyncio
+async def test_mypy_unreadable() -> None:
+    """MyPy output that is not an annotation or summary is an error."""
+
+    results = await parse_output(MyPy, "mypy: can't read file 'a.py': No such file or directory\n")
+
+    (result,) = results
+    assert isinstance(result, OutputParsingError)
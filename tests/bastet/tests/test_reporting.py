@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2024 Mewbot Developers <mewbot@quicksilver.london>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""
+Tests for the Bastet reporters.
+"""
+
+from __future__ import annotations as _future_annotations
+
+import pathlib
+
+import pytest
+from bastet.reporting.console import _indent
+from bastet.reporting.github import GitHubReporter
+from bastet.tools import Annotation, Status
+
+FILE = pathlib.Path(__file__)
+
+
+class TestGitHubReporter:
+    """
+    Tests for the GitHub annotation summary.
+    """
+
+    def test_group_issues(self) -> None:
+        """Issues on the same line are grouped, and duplicates are dropped."""
+
+        annotations = [
+            Annotation(Status.ISSUE, (FILE, 1, 0), "E1", "first"),
+            Annotation(Status.WARNING, (FILE, 1, 0), "E2", "second", "more\ndetail"),
+            Annotation(Status.ISSUE, (FILE, 1, 0), "E1", "first"),
+            Annotation(Status.ISSUE, (FILE, 2, 0), "E1", "alone"),
+            Annotation(Status.ISSUE, (FILE, 2, 0), "E1", "alone"),
+            Annotation(Status.PASSED, (FILE, 3, 0), "pass", "skipped"),
+        ]
+
+        grouped, alone = GitHubReporter().group_issues(annotations)
+
+        assert grouped.source == (FILE, 1, 0)
+        assert (grouped.status, grouped.code) == (Status.ISSUE, "group")
+        assert grouped.message == "2 issues on this line"
+        assert grouped.description == "- first\n\n- second\n  more\n  detail"
+        assert alone is annotations[3]
+
+    def test_sub_issue_single_line(self) -> None:
+        """A single line description is indented under the issue."""
+
+        issue = Annotation(Status.ISSUE, (FILE, 1, 0), "E1", "first", "detail  ")
+
+        assert GitHubReporter.format_sub_issue(issue) == "- first\n  detail"
+
+    def test_sub_issue_multi_line(self) -> None:
+        """Each line of a multi-line description is indented under the issue."""
+
+        issue = Annotation(Status.ISSUE, (FILE, 1, 0), "E1", "first", "more\ndetail\n")
+
+        assert GitHubReporter.format_sub_issue(issue) == "- first\n  more\n  detail"
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        pytest.param("detail", "  detail", id="single-line"),
+        pytest.param("more\ndetail", "  more\n  detail", id="multi-line"),
+    ],
+)
+def test_console_indent(text: str, expected: str) -> None:
+    """Console descriptions are indented, whether or not they span several lines."""
+
+    assert _indent(text) == expected
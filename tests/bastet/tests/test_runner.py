@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2024 Mewbot Developers <mewbot@quicksilver.london>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""
+Tests for running the tools with the Bastet runner.
+"""
+
+from __future__ import annotations as _future_annotations
+
+from collections.abc import AsyncIterable
+
+import argparse
+import asyncio
+import logging
+import pathlib
+import sys
+
+import pytest
+from bastet import runner
+from bastet.config import BastetConfiguration, add_options
+from bastet.reporting import ReportHandler
+from bastet.tools import Annotation, Tool, ToolDomain, ToolError
+from bastet.tools.exceptions import OutputParsingError
+
+LOGGER = logging.getLogger("bastet.tests")
+
+
+class Missing(Tool):
+    """
+    A tool whose program does not exist.
+    """
+
+    @classmethod
+    def domains(cls) -> set[ToolDomain]:
+        """Missing: Lint = fail to start."""
+        return {ToolDomain.LINT}
+
+    def get_command(self) -> list[str | pathlib.Path]:
+        """Command string to execute (including arguments)."""
+        return ["bastet-test-missing-program"]
+
+    def get_environment(self) -> dict[str, str]:
+        """Environment variables to set when calling this tool."""
+        return {}
+
+    async def process_results(
+        self,
+        data: asyncio.StreamReader,
+    ) -> AsyncIterable[Annotation | ToolError]:
+        """Never reached, as the program can not be started."""
+        yield OutputParsingError(data=(await data.read()).decode())
+
+
+@pytest.mark.asyncio
+async def test_tool_fails_to_start(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A tool that fails to start raises its own error, not an ExceptionGroup."""
+
+    (tmp_path / "pyproject.toml").touch()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(runner, "enabled_tools", lambda _: [Missing])
+
+    parsed = add_options(argparse.ArgumentParser()).parse_args(["--root", str(tmp_path)])
+    config = BastetConfiguration(LOGGER, parsed)
+
+    with pytest.raises(FileNotFoundError) as error:
+        await runner.BastetRunner(config, ReportHandler(LOGGER)).run()
+
+    assert error.value.__suppress_context__
+
+
+def test_skipped_tools_not_imported(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skipping every tool in a module means that module is never imported."""
+
+    monkeypatch.delitem(sys.modules, "bastet.tools.audit", raising=False)
+
+    tools = runner.get_available_tools({"bandit"})
+
+    assert "Bandit" not in {tool.__name__ for tool in tools}
+    assert "bastet.tools.audit" not in sys.modules